@@ -29,8 +29,12 @@ function yearsFromRows(rows) {
   const out = [];
   for (const r of rows) {
     const y = r?.Year;
-    if (typeof y === 'number' && Number.isFinite(y)) out.push(y);
-    else if (typeof y === 'string' && y.trim() && Number.isFinite(parseInt(y.trim(), 10))) out.push(parseInt(y.trim(), 10));
+    if (typeof y === 'number') {
+      if (Number.isFinite(y)) out.push(y);
+    } else if (typeof y === 'string') {
+      const n = parseInt(y, 10);
+      if (Number.isFinite(n)) out.push(n);
+    }
   }
   return out;
 }
@@ -60,15 +64,21 @@ function parseYearFromCountDateString(countDate) {
 }
 
 function joinWeatherWithYearInfo(weatherRows, participantsEffortRows, metaRows) {
-  const peByIdx = new Map((participantsEffortRows || []).map((r) => [r.CountIndex, r]));
-  const metaByIdx = new Map((metaRows || []).map((r) => [r.CountIndex, r]));
+  const yearInfoByIdx = new Map();
+  for (const r of (metaRows || [])) {
+    yearInfoByIdx.set(r.CountIndex, { Year: r.Year || null, CountDate: r.CountDate || null });
+  }
+  for (const r of (participantsEffortRows || [])) {
+    const prev = yearInfoByIdx.get(r.CountIndex);
+    yearInfoByIdx.set(r.CountIndex, {
+      Year: r.Year || prev?.Year || null,
+      CountDate: r.CountDate || prev?.CountDate || null,
+    });
+  }
 
   return (weatherRows || []).map((w) => {
-    const pe = peByIdx.get(w.CountIndex);
-    const meta = metaByIdx.get(w.CountIndex);
-    const Year = (pe && pe.Year) || (meta && meta.Year) || null;
-    const CountDate = (pe && pe.CountDate) || (meta && meta.CountDate) || null;
-    return { Year, CountDate, ...w };
+    const info = yearInfoByIdx.get(w.CountIndex);
+    return { Year: info?.Year ?? null, CountDate: info?.CountDate ?? null, ...w };
   });
 }
 
@@ -212,11 +222,12 @@ async function main() {
   const __dirname = path.dirname(__filename);
   const repoRoot = path.resolve(__dirname, '..');
 
-  for (const seed of SEEDS) {
-    const url = buildCsvUrl(seed);
-    process.stdout.write(`Fetching ${seed.code}... `);
-    const csvText = await fetchCsvText(url);
-    process.stdout.write('parsing... ');
+  process.stdout.write(`Fetching ${SEEDS.map((s) => s.code).join(', ')}...\n`);
+  const csvTexts = await Promise.all(SEEDS.map((seed) => fetchCsvText(buildCsvUrl(seed))));
+
+  for (const [i, seed] of SEEDS.entries()) {
+    const csvText = csvTexts[i];
+    process.stdout.write(`${seed.code}: parsing... `);
     const state = await buildStateFromCsvText(csvText);
     process.stdout.write('writing sqlite... ');
     const outPath = path.join(repoRoot, 'public', 'seed', `${seed.code}.sqlite`);
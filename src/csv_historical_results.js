@@ -1,18 +1,45 @@
+const NUMERIC_RE = /^-?\d+(?:\.\d+)?$/;
+const TEMP_RE = /(-?\d+(?:\.\d+)?)\s*(Celsius|Fahrenheit)?/i;
+const WHITESPACE_RUN_RE = /\s+/g;
+const YEAR_HEADER_RE = /^\s*(19\d{2}|20\d{2})\s*\[(\d+)\]/;
+const COUNT_DATE_RE = /Count Date:\s*([0-9]{1,2}\/[0-9]{1,2}\/[0-9]{4})/;
+const PARTICIPANTS_RE = /#\s*Participants:\s*([0-9]+)/;
+const SPECIES_REPORTED_RE = /#\s*Species Reported:\s*([0-9]+)/;
+const TOTAL_HRS_RE = /Total Hrs\.:\s*([0-9]+(?:\.[0-9]+)?)/;
+
+const WEATHER_TEXT_COLUMNS = ['AMClouds', 'PMClouds', 'AMRain', 'PMRain', 'AMSnow', 'PMSnow'];
+
 function normalizeNewlines(s) {
 	return String(s ?? '').replaceAll('\r\n', '\n').replaceAll('\r', '\n');
 }
 
-function isNumericLike(v) {
+function parseNumericLikeInt(v) {
 	const s = String(v ?? '').trim();
-	return s !== '' && /^-?\d+(?:\.\d+)?$/.test(s);
+	if (s === '' || !NUMERIC_RE.test(s)) return null;
+	return parseInt(s, 10);
+}
+
+function cleanCell(v) {
+	return String(v ?? '').replace(WHITESPACE_RUN_RE, ' ').trim();
+}
+
+function cachedBy(cache, key, compute) {
+	let v = cache.get(key);
+	if (v === undefined) {
+		v = compute(key);
+		cache.set(key, v);
+	}
+	return v;
 }
 
 function parseTempFString(v) {
 	const s = String(v ?? '').trim();
-	const m = s.match(/-?\d+(?:\.\d+)?/);
+	const m = s.match(TEMP_RE);
 	if (!m) return null;
-	const n = parseFloat(m[0]);
-	return Number.isFinite(n) ? n : null;
+	const n = parseFloat(m[1]);
+	if (!Number.isFinite(n)) return null;
+	if (m[2] && m[2].toLowerCase() === 'celsius') return Math.round((n * 9 / 5 + 32) * 10) / 10;
+	return n;
 }
 
 function parseMaybeInt(v) {
@@ -22,6 +49,17 @@ function parseMaybeInt(v) {
 	return Number.isFinite(n) ? n : null;
 }
 
+function parseCountCell(v) {
+	if (typeof v !== 'string' || v.length === 0 || v.length > 9) return parseMaybeInt(v) ?? 0;
+	let n = 0;
+	for (let i = 0; i < v.length; i++) {
+		const d = v.charCodeAt(i) - 48;
+		if (d < 0 || d > 9) return parseMaybeInt(v) ?? 0;
+		n = n * 10 + d;
+	}
+	return n;
+}
+
 function parseMaybeFloat(v) {
 	const s = String(v ?? '').trim();
 	if (!s) return null;
@@ -59,43 +97,52 @@ export function parseCsvText(text, { maxRows = 250000, maxCols = 200 } = {}) {
 		row = [];
 	};
 
-	for (let i = 0; i < s.length; i++) {
-		const ch = s[i];
-
+	const n = s.length;
+	let i = 0;
+	while (i < n) {
 		if (inQuotes) {
-			if (ch === '"') {
-				const next = s[i + 1];
-				if (next === '"') {
-					field += '"';
-					i++;
-				} else {
-					inQuotes = false;
-				}
+			const q = s.indexOf('"', i);
+			if (q === -1) {
+				field += s.slice(i);
+				break;
+			}
+			field += s.slice(i, q);
+			if (s.charCodeAt(q + 1) === 34) {
+				field += '"';
+				i = q + 2;
 			} else {
-				field += ch;
+				inQuotes = false;
+				i = q + 1;
 			}
 			continue;
 		}
 
-		if (ch === '"') {
-			inQuotes = true;
-			continue;
+		let j = i;
+		while (j < n) {
+			const c = s.charCodeAt(j);
+			if (c === 44 || c === 10 || c === 34) break;
+			j++;
 		}
+		if (j > i) field += s.slice(i, j);
+		if (j >= n) break;
 
-		if (ch === ',') {
-			pushField();
-			if (row.length > maxCols) throw new Error(`CSV has too many columns (>${maxCols}).`);
+		const c = s.charCodeAt(j);
+		i = j + 1;
+
+		if (c === 34) {
+			inQuotes = true;
 			continue;
 		}
 
-		if (ch === '\n') {
+		if (c === 44) {
 			pushField();
-			pushRow();
-			if (rows.length > maxRows) throw new Error(`CSV has too many rows (>${maxRows}).`);
+			if (row.length > maxCols) throw new Error(`CSV has too many columns (>${maxCols}).`);
 			continue;
 		}
 
-		field += ch;
+		pushField();
+		pushRow();
+		if (rows.length > maxRows) throw new Error(`CSV has too many rows (>${maxRows}).`);
 	}
 
 	pushField();
@@ -104,18 +151,27 @@ export function parseCsvText(text, { maxRows = 250000, maxCols = 200 } = {}) {
 	return rows;
 }
 
+function firstLine(s) {
+	const nl = s.indexOf('\n');
+	return nl === -1 ? s : s.slice(0, nl);
+}
+
+function speciesNameFromCell(v) {
+	return firstLine(String(v ?? '').trim()).trim();
+}
+
 function parseYearHeaderCell(cell) {
-	const s = normalizeNewlines(cell);
-	const head = s.split('\n')[0] || '';
-	const m = head.match(/^\s*(19\d{2}|20\d{2})\s*\[(\d+)\]/);
+	const s = String(cell ?? '');
+	const head = firstLine(s);
+	const m = head.match(YEAR_HEADER_RE);
 	if (!m) return null;
 	const Year = parseInt(m[1], 10);
 	const CountIndex = parseInt(m[2], 10);
 
-	const dm = s.match(/Count Date:\s*([0-9]{1,2}\/[0-9]{1,2}\/[0-9]{4})/);
-	const pm = s.match(/#\s*Participants:\s*([0-9]+)/);
-	const sm = s.match(/#\s*Species Reported:\s*([0-9]+)/);
-	const hm = s.match(/Total Hrs\.:\s*([0-9]+(?:\.[0-9]+)?)/);
+	const dm = s.match(COUNT_DATE_RE);
+	const pm = s.match(PARTICIPANTS_RE);
+	const sm = s.match(SPECIES_REPORTED_RE);
+	const hm = s.match(TOTAL_HRS_RE);
 
 	return {
 		Year: Number.isFinite(Year) ? Year : null,
@@ -135,6 +191,25 @@ function uniqueSortedYearsFromMeta(meta) {
 	return Array.from(set).sort((a, b) => a - b);
 }
 
+function findSectionStarts(rows) {
+	const starts = { circle: -1, weather: -1, participantsEffort: -1, species: -1 };
+	for (let i = 0; i < rows.length; i++) {
+		const r = rows[i] || [];
+		const c0 = r[0];
+		if (starts.circle === -1 && i < 50 && c0 === 'CircleName' && r[1] === 'Abbrev') {
+			starts.circle = i;
+		} else if (starts.weather === -1 && c0 === 'CountYear3' && (r[1] || '').toLowerCase().includes('lowtemp')) {
+			starts.weather = i;
+		} else if (starts.participantsEffort === -1 && c0 === 'CountYear5') {
+			starts.participantsEffort = i;
+		} else if (starts.species === -1 && c0 === 'COM_NAME' && r[1] === 'CountYear') {
+			starts.species = i;
+		}
+		if ((starts.circle !== -1 || i >= 49) && starts.weather !== -1 && starts.participantsEffort !== -1 && starts.species !== -1) break;
+	}
+	return starts;
+}
+
 export function parseHistoricalResultsByCountCsv(text) {
 	const rows = parseCsvText(text, { maxRows: 250000, maxCols: 200 });
 
@@ -150,22 +225,27 @@ export function parseHistoricalResultsByCountCsv(text) {
 		CompilerEmail: null,
 	};
 
-	const norm = (v) => String(v ?? '').replace(/\s+/g, ' ').trim();
-	const firstNonEmptyAfter = (r, idx) => {
-		for (let j = idx + 1; j < (r || []).length; j++) {
-			const s = norm(r[j]);
-			if (s) return s;
+	const firstNonEmptyAfter = (cells, idx) => {
+		for (let j = idx + 1; j < cells.length; j++) {
+			if (cells[j]) return cells[j];
 		}
 		return null;
 	};
 
+	const headRows = [];
+	for (let i = 0; i < Math.min(rows.length, 81); i++) {
+		const r = rows[i];
+		headRows.push(Array.isArray(r) ? r.map(cleanCell) : []);
+	}
+
 	for (let i = 0; i < Math.min(rows.length, 80); i++) {
-		const r = rows[i] || [];
-		if (!Array.isArray(r) || r.length === 0) continue;
+		const cells = headRows[i];
+		if (cells.length === 0) continue;
+		const lowers = cells.map((c) => c.toLowerCase());
 
 		const headerIndexes = new Map();
-		for (let j = 0; j < r.length; j++) {
-			const key = norm(r[j]).toLowerCase();
+		for (let j = 0; j < lowers.length; j++) {
+			const key = lowers[j];
 			if (!key) continue;
 			if (key === 'compilerfirstname') headerIndexes.set('first', j);
 			if (key === 'compilerlastname') headerIndexes.set('last', j);
@@ -173,124 +253,112 @@ export function parseHistoricalResultsByCountCsv(text) {
 			if (key === 'compilername' || key === 'compiler') headerIndexes.set('name', j);
 		}
 		if (headerIndexes.size) {
-			const v = rows[i + 1] || [];
-			if (headerIndexes.has('first')) countInfo.CompilerFirstName = norm(v[headerIndexes.get('first')]) || countInfo.CompilerFirstName;
-			if (headerIndexes.has('last')) countInfo.CompilerLastName = norm(v[headerIndexes.get('last')]) || countInfo.CompilerLastName;
-			if (headerIndexes.has('email')) countInfo.CompilerEmail = norm(v[headerIndexes.get('email')]) || countInfo.CompilerEmail;
-			if (headerIndexes.has('name')) countInfo.CompilerName = norm(v[headerIndexes.get('name')]) || countInfo.CompilerName;
+			const v = headRows[i + 1] || [];
+			if (headerIndexes.has('first')) countInfo.CompilerFirstName = v[headerIndexes.get('first')] || countInfo.CompilerFirstName;
+			if (headerIndexes.has('last')) countInfo.CompilerLastName = v[headerIndexes.get('last')] || countInfo.CompilerLastName;
+			if (headerIndexes.has('email')) countInfo.CompilerEmail = v[headerIndexes.get('email')] || countInfo.CompilerEmail;
+			if (headerIndexes.has('name')) countInfo.CompilerName = v[headerIndexes.get('name')] || countInfo.CompilerName;
 		}
 
-		for (let j = 0; j < r.length; j++) {
-			const cell = norm(r[j]);
+		for (let j = 0; j < cells.length; j++) {
+			const cell = cells[j];
 			if (!cell) continue;
-			const lower = cell.toLowerCase();
+			const lower = lowers[j];
 
 			if (lower.includes('compiler email') || (lower.includes('compiler') && lower.includes('email'))) {
 				const inline = cell.split(':').slice(1).join(':').trim();
-				const v = inline || firstNonEmptyAfter(r, j);
+				const v = inline || firstNonEmptyAfter(cells, j);
 				if (v) countInfo.CompilerEmail = v;
 				continue;
 			}
 
 			if (lower.startsWith('compiler') || lower.startsWith('current compiler')) {
 				const inline = cell.split(':').slice(1).join(':').trim();
-				const v = inline || firstNonEmptyAfter(r, j);
+				const v = inline || firstNonEmptyAfter(cells, j);
 				if (v) countInfo.CompilerName = v;
 				continue;
 			}
 		}
 	}
 
-	for (let i = 0; i < Math.min(rows.length, 50); i++) {
-		const r = rows[i] || [];
-		if (r[0] === 'CircleName' && r[1] === 'Abbrev') {
-			const v = rows[i + 1] || [];
-			countInfo.CountName = String(v[0] ?? '').trim() || null;
-			countInfo.CountCode = String(v[1] ?? '').trim() || null;
-			const ll = parseLatLong(v[2]);
-			countInfo.Lat = ll.Lat;
-			countInfo.Lon = ll.Lon;
-			break;
-		}
+	const sections = findSectionStarts(rows);
+
+	if (sections.circle !== -1) {
+		const v = rows[sections.circle + 1] || [];
+		countInfo.CountName = String(v[0] ?? '').trim() || null;
+		countInfo.CountCode = String(v[1] ?? '').trim() || null;
+		const ll = parseLatLong(v[2]);
+		countInfo.Lat = ll.Lat;
+		countInfo.Lon = ll.Lon;
 	}
 
 	const weatherRaw = [];
+	const weatherText = new Map();
 
 	const participantsEffort = [];
 
 	const meta = [];
 	const metaSeen = new Set();
 
-	for (let i = 0; i < rows.length; i++) {
-		const r = rows[i] || [];
-		if (r[0] === 'CountYear3' && (r[1] || '').toLowerCase().includes('lowtemp')) {
-			for (let j = i + 1; j < rows.length; j++) {
-				const d = rows[j] || [];
-				if (!d.length) break;
-				if (!isNumericLike(d[0])) break;
-				const CountIndex = parseMaybeInt(d[0]);
-				if (!CountIndex) continue;
-				weatherRaw.push({
-					CountIndex,
-					LowTempF: parseTempFString(d[1]),
-					HighTempF: parseTempFString(d[2]),
-					AMClouds: String(d[3] ?? ''),
-					PMClouds: String(d[4] ?? ''),
-					AMRain: String(d[5] ?? ''),
-					PMRain: String(d[6] ?? ''),
-					AMSnow: String(d[7] ?? ''),
-					PMSnow: String(d[8] ?? ''),
-				});
+	if (sections.weather !== -1) {
+		for (let j = sections.weather + 1; j < rows.length; j++) {
+			const d = rows[j] || [];
+			if (!d.length) break;
+			const CountIndex = parseNumericLikeInt(d[0]);
+			if (CountIndex === null) break;
+			if (!CountIndex) continue;
+			const rec = {
+				CountIndex,
+				LowTempF: parseTempFString(d[1]),
+				HighTempF: parseTempFString(d[2]),
+			};
+			for (let k = 0; k < WEATHER_TEXT_COLUMNS.length; k++) {
+				rec[WEATHER_TEXT_COLUMNS[k]] = cachedBy(weatherText, d[3 + k], cleanCell);
 			}
-			break;
+			weatherRaw.push(rec);
 		}
 	}
 
-	for (let i = 0; i < rows.length; i++) {
-		const r = rows[i] || [];
-		if (r[0] === 'CountYear5') {
-			for (let j = i + 1; j < rows.length; j++) {
-				const d = rows[j] || [];
-				if (!d.length) break;
-				if (!isNumericLike(d[0])) break;
-				const CountIndex = parseMaybeInt(d[0]);
-				if (!CountIndex) continue;
-
-				const CountDate = String(d[1] ?? '').trim() || null;
-				participantsEffort.push({
-					CountIndex,
-					CountDate,
-					Year: null,
-					NumParticipants: parseMaybeInt(d[2]),
-					NumHours: parseMaybeFloat(d[3]),
-					NumSpeciesReported: parseMaybeInt(d[4]),
-				});
-			}
-			break;
+	if (sections.participantsEffort !== -1) {
+		for (let j = sections.participantsEffort + 1; j < rows.length; j++) {
+			const d = rows[j] || [];
+			if (!d.length) break;
+			const CountIndex = parseNumericLikeInt(d[0]);
+			if (CountIndex === null) break;
+			if (!CountIndex) continue;
+
+			const CountDate = String(d[1] ?? '').trim() || null;
+			participantsEffort.push({
+				CountIndex,
+				CountDate,
+				Year: null,
+				NumParticipants: parseMaybeInt(d[2]),
+				NumHours: parseMaybeFloat(d[3]),
+				NumSpeciesReported: parseMaybeInt(d[4]),
+			});
 		}
 	}
 
-	let speciesSectionStart = -1;
-	for (let i = 0; i < rows.length; i++) {
-		const r = rows[i] || [];
-		if (r[0] === 'COM_NAME' && r[1] === 'CountYear') {
-			speciesSectionStart = i + 1;
-			break;
-		}
-	}
+	const speciesSectionStart = sections.species !== -1 ? sections.species + 1 : -1;
 
+	const peByIdx = new Map();
+	for (const r of participantsEffort) {
+		if (!peByIdx.has(r.CountIndex)) peByIdx.set(r.CountIndex, r);
+	}
 	const countsBySpecies = new Map();
+	const yearHeaderCache = new Map();
+	const speciesNames = new Map();
 
 	if (speciesSectionStart !== -1) {
 		for (let j = speciesSectionStart; j < rows.length; j++) {
 			const d = rows[j] || [];
 			if (!d.length) break;
 
-			const speciesRaw = String(d[0] ?? '').trim();
+			const species = cachedBy(speciesNames, d[0], speciesNameFromCell);
 			const hdr = d[1];
-			if (!speciesRaw || !hdr) continue;
+			if (!species || !hdr) continue;
 
-			const yh = parseYearHeaderCell(hdr);
+			const yh = cachedBy(yearHeaderCache, hdr, parseYearHeaderCell);
 			if (!yh || yh.CountIndex === null || yh.Year === null) continue;
 
 			const CountIndex = yh.CountIndex;
@@ -302,7 +370,7 @@ export function parseHistoricalResultsByCountCsv(text) {
 				meta.push({ CountIndex, Year, CountDate: CountDate || null });
 			}
 
-			const existing = participantsEffort.find((r) => r.CountIndex === CountIndex);
+			const existing = peByIdx.get(CountIndex);
 			if (existing) {
 				if (!existing.CountDate && CountDate) existing.CountDate = CountDate;
 				if (existing.NumParticipants === null && yh.NumParticipants !== null) existing.NumParticipants = yh.NumParticipants;
@@ -310,8 +378,7 @@ export function parseHistoricalResultsByCountCsv(text) {
 				if (existing.NumHours === null && yh.TotalHrs !== null) existing.NumHours = yh.TotalHrs;
 			}
 
-			const species = speciesRaw.split('\n')[0].trim();
-			const countVal = parseMaybeInt(d[2]) ?? 0;
+			const countVal = parseCountCell(d[2]);
 			let m = countsBySpecies.get(species);
 			if (!m) {
 				m = new Map();
@@ -322,11 +389,13 @@ export function parseHistoricalResultsByCountCsv(text) {
 	}
 
 	const years = uniqueSortedYearsFromMeta(meta);
+	const yearKeys = years.map(String);
 	const speciesTable = [];
 	for (const [species, byYear] of countsBySpecies.entries()) {
 		const rec = { Species: species };
-		for (const y of years) {
-			if (byYear.has(y)) rec[String(y)] = byYear.get(y);
+		for (let k = 0; k < years.length; k++) {
+			const v = byYear.get(years[k]);
+			if (v !== undefined) rec[yearKeys[k]] = v;
 		}
 		speciesTable.push(rec);
 	}
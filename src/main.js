@@ -5,6 +5,12 @@ import leafletMarker2x from 'leaflet/dist/images/marker-icon-2x.png?url';
 import leafletMarker from 'leaflet/dist/images/marker-icon.png?url';
 import leafletMarkerShadow from 'leaflet/dist/images/marker-shadow.png?url';
 
+const CR_RE = /\r/g;
+const WHITESPACE_RUN_RE = /\s+/g;
+const INT_RE = /^-?\d+$/;
+const INT_FLOAT_RE = /^-?\d+\.0+$/;
+const YEAR_IN_DATE_RE = /\b(19\d{2}|20\d{2})\b/;
+
 let plotlyPromise = null;
 let plotlyRef = null;
 async function getPlotly() {
@@ -512,11 +518,11 @@ panelHeaderEl?.addEventListener('click', (e) => {
     e.preventDefault();
     if (!state.species) return;
     const cfg = getTableConfig(activeTab);
-    const csv = rowsToCsv(cfg.rows || [], cfg.columns || []);
+    const csvLines = rowsToCsvLines(cfg.rows || [], cfg.columns || []);
     const ci = state.countInfo || {};
     const base = sanitizeFilenamePart(ci.CountCode || ci.CountName || 'cbc');
     const tab = sanitizeFilenamePart(cfg.title || activeTab);
-    downloadCsv(`${base}_${tab}.csv`, csv);
+    downloadCsv(`${base}_${tab}.csv`, csvLines);
     return;
   }
 
@@ -552,11 +558,11 @@ plotExportOverlayBtnEl?.addEventListener('click', (e) => {
   e.preventDefault();
   if (!state.species) return;
   const cfg = getTableConfig(activeTab);
-  const csv = rowsToCsv(cfg.rows || [], cfg.columns || []);
+  const csvLines = rowsToCsvLines(cfg.rows || [], cfg.columns || []);
   const ci = state.countInfo || {};
   const base = sanitizeFilenamePart(ci.CountCode || ci.CountName || 'cbc');
   const tab = sanitizeFilenamePart(cfg.title || activeTab);
-  downloadCsv(`${base}_${tab}.csv`, csv);
+  downloadCsv(`${base}_${tab}.csv`, csvLines);
 });
 
 function renderPlotSpeciesOverlay() {
@@ -1519,12 +1525,16 @@ async function saveCountsIndex(index) {
   await idbSet(IDB_KEY_INDEX, index);
 }
 
-async function buildIndexRowFromSqliteBytes(code, buf) {
-  const SQL = await getSql();
-  const db = new SQL.Database(new Uint8Array(buf));
-  const readJson = (key) => {
-    const res = db.exec('SELECT value FROM kv WHERE key = ' + JSON.stringify(key));
-    const v = res?.[0]?.values?.[0]?.[0];
+function makeKvJsonReader(db) {
+  const stmt = db.prepare('SELECT value FROM kv WHERE key = ?');
+  const read = (key) => {
+    let v = null;
+    try {
+      stmt.bind([key]);
+      if (stmt.step()) v = stmt.get()[0];
+    } finally {
+      stmt.reset();
+    }
     if (!v) return null;
     try {
       return JSON.parse(v);
@@ -1532,11 +1542,20 @@ async function buildIndexRowFromSqliteBytes(code, buf) {
       return null;
     }
   };
+  return { read, free: () => stmt.free() };
+}
+
+async function buildIndexRowFromSqliteBytes(code, buf) {
+  const SQL = await getSql();
+  const db = new SQL.Database(new Uint8Array(buf));
+  const kv = makeKvJsonReader(db);
+  const readJson = kv.read;
 
   const ci = readJson('countInfo') || {};
   const ranges = readJson('ranges') || {};
   const years = readJson('years') || [];
   const maxCountIndex = readJson('maxCountIndex');
+  kv.free();
   db.close();
 
   const name = ci.CountName || ci.CountCode || code;
@@ -1826,17 +1845,8 @@ async function loadStateFromSqlite(code) {
   if (!buf) throw new Error('No stored database found for that count.');
   const SQL = await getSql();
   const db = new SQL.Database(new Uint8Array(buf));
-
-  const readJson = (key) => {
-    const res = db.exec('SELECT value FROM kv WHERE key = ' + JSON.stringify(key));
-    const v = res?.[0]?.values?.[0]?.[0];
-    if (!v) return null;
-    try {
-      return JSON.parse(v);
-    } catch {
-      return null;
-    }
-  };
+  const kv = makeKvJsonReader(db);
+  const readJson = kv.read;
 
   const parsed = {
     countInfo: readJson('countInfo'),
@@ -1852,6 +1862,7 @@ async function loadStateFromSqlite(code) {
     effort: readJson('effort'),
     participation: readJson('participation'),
   };
+  kv.free();
   db.close();
 
   state = {
@@ -2126,8 +2137,8 @@ function normalizeCell(v) {
 }
 
 function cleanText(v) {
-  const s = normalizeCell(v).replace(/\r/g, '');
-  return s.replace(/\s+/g, ' ').trim();
+  const s = normalizeCell(v).replace(CR_RE, '');
+  return s.replace(WHITESPACE_RUN_RE, ' ').trim();
 }
 
 function yearsFromRows(rows) {
@@ -2135,8 +2146,12 @@ function yearsFromRows(rows) {
   const out = [];
   for (const r of rows) {
     const y = r?.Year;
-    if (typeof y === 'number' && Number.isFinite(y)) out.push(y);
-    else if (typeof y === 'string' && y.trim() && Number.isFinite(parseInt(y.trim(), 10))) out.push(parseInt(y.trim(), 10));
+    if (typeof y === 'number') {
+      if (Number.isFinite(y)) out.push(y);
+    } else if (typeof y === 'string') {
+      const n = parseInt(y, 10);
+      if (Number.isFinite(n)) out.push(n);
+    }
   }
   return out;
 }
@@ -2258,30 +2273,36 @@ function parseCount(v) {
   const s = cleanText(v);
   if (!s) return 0;
   if (s.toLowerCase() === 'cw') return 0;
-  if (/^-?\d+$/.test(s)) return parseInt(s, 10);
-  if (/^-?\d+\.0+$/.test(s)) return Math.round(parseFloat(s));
+  if (INT_RE.test(s)) return parseInt(s, 10);
+  if (INT_FLOAT_RE.test(s)) return Math.round(parseFloat(s));
   return 0;
 }
 
 function yearFromCountDateString(countDate) {
   const s = cleanText(countDate);
   if (!s) return null;
-  const m = s.match(/\b(19\d{2}|20\d{2})\b/);
+  const m = s.match(YEAR_IN_DATE_RE);
   if (!m) return null;
   const y = parseInt(m[1], 10);
   return Number.isFinite(y) ? y : null;
 }
 
 function joinWeatherWithYearInfo(weatherRows, participantsEffortRows, metaRows) {
-  const peByIdx = new Map(participantsEffortRows.map((r) => [r.CountIndex, r]));
-  const metaByIdx = new Map(metaRows.map((r) => [r.CountIndex, r]));
+  const yearInfoByIdx = new Map();
+  for (const r of metaRows) {
+    yearInfoByIdx.set(r.CountIndex, { Year: r.Year || null, CountDate: r.CountDate || null });
+  }
+  for (const r of participantsEffortRows) {
+    const prev = yearInfoByIdx.get(r.CountIndex);
+    yearInfoByIdx.set(r.CountIndex, {
+      Year: r.Year || prev?.Year || null,
+      CountDate: r.CountDate || prev?.CountDate || null,
+    });
+  }
 
   return weatherRows.map((w) => {
-    const pe = peByIdx.get(w.CountIndex);
-    const meta = metaByIdx.get(w.CountIndex);
-    const Year = (pe && pe.Year) || (meta && meta.Year) || null;
-    const CountDate = (pe && pe.CountDate) || (meta && meta.CountDate) || null;
-    return { Year, CountDate, ...w };
+    const info = yearInfoByIdx.get(w.CountIndex);
+    return { Year: info?.Year ?? null, CountDate: info?.CountDate ?? null, ...w };
   });
 }
 
@@ -2385,7 +2406,14 @@ function renderTable(rows, columns, opts = {}) {
     return '';
   };
 
-  const thead = cols.map((c) => `<th class="${colClass(c)}">${escapeHtml(c)}</th>`).join('');
+  const colMeta = cols.map((c) => ({
+    key: c,
+    cls: colClass(c),
+    isYearCol: /^\d{4}$/.test(c),
+    yearNum: parseInt(c, 10),
+  }));
+
+  const thead = colMeta.map(({ key, cls }) => `<th class="${cls}">${escapeHtml(key)}</th>`).join('');
   const tbody = rows
     .map((r) => {
       const isSelected =
@@ -2393,28 +2421,26 @@ function renderTable(rows, columns, opts = {}) {
         opts.clickSpecies &&
         cleanText(r?.Species || '') &&
         String(r.Species) === String(opts.selectedSpecies);
-      const tds = cols
-        .map((c) => {
+      const tds = colMeta
+        .map(({ key: c, cls, isYearCol, yearNum }) => {
           const v = r[c];
-          const isYearCol = /^\d{4}$/.test(c);
           if (opts.clickSpecies && c === 'Species') {
             const sp = r.Species;
             const spDisplay = stripBracketedText(sp);
-            return `<td class="cell-link ${colClass(c)}" data-action="plot-species" data-species="${escapeHtml(
+            return `<td class="cell-link ${cls}" data-action="plot-species" data-species="${escapeHtml(
               sp === null || sp === undefined ? '' : String(sp)
             )}">${escapeHtml(spDisplay)}</td>`;
           }
           if (opts.ndForMissingYears && isYearCol) {
-            const yearNum = parseInt(c, 10);
             const missingSet = opts.missingYearsSet;
             if (missingSet && missingSet.has(yearNum)) {
-              return `<td class="${colClass(c)}">ND</td>`;
+              return `<td class="${cls}">ND</td>`;
             }
             if (v === null || v === undefined || String(v).trim() === '') {
-              return `<td class="${colClass(c)}">0</td>`;
+              return `<td class="${cls}">0</td>`;
             }
           }
-          return `<td class="${colClass(c)}">${escapeHtml(v === null || v === undefined ? '' : String(v))}</td>`;
+          return `<td class="${cls}">${escapeHtml(v === null || v === undefined ? '' : String(v))}</td>`;
         })
         .join('');
       return `<tr class="${isSelected ? 'is-selected' : ''}">${tds}</tr>`;
@@ -2475,6 +2501,8 @@ function renderPanel(active) {
     const years = state.yearsFull || state.years || [];
     const missingYearsSet = new Set((state.missingYears || []).filter((y) => typeof y === 'number' && Number.isFinite(y)));
 
+    const yearKeys = years.map(String);
+
     let rows = state.species;
     rows = (rows || []).filter((r) => !isSpRecord(r?.Species || ''));
     if (state.speciesFilterRare || state.speciesFilterOwls) {
@@ -2483,14 +2511,14 @@ function renderPanel(active) {
         if (state.speciesFilterOwls && !/\bowls?\b/i.test(spName)) return false;
         if (state.speciesFilterRare) {
           let total = 0;
-          for (const y of years) total += parseCount(r?.[String(y)]);
+          for (const k of yearKeys) total += parseCount(r?.[k]);
           if (total > 2) return false;
         }
         return true;
       });
     }
 
-    panelEl.innerHTML = renderTable(rows, ['Species', ...years.map(String)], {
+    panelEl.innerHTML = renderTable(rows, ['Species', ...yearKeys], {
       clickSpecies: true,
       ndForMissingYears: true,
       missingYearsSet,
@@ -2569,16 +2597,21 @@ function getTableConfig(active) {
 
 function csvEscapeCell(v) {
   if (v === null || v === undefined) return '';
+  if (typeof v === 'number') return String(v);
   const s = String(v);
   if (/[",\n\r]/.test(s)) return `"${s.replaceAll('"', '""')}"`;
   return s;
 }
 
-function rowsToCsv(rows, columns) {
+function rowsToCsvLines(rows, columns) {
   const cols = columns && columns.length ? columns : rows.length ? Object.keys(rows[0]) : [];
-  const header = cols.map(csvEscapeCell).join(',');
-  const lines = rows.map((r) => cols.map((c) => csvEscapeCell(r[c])).join(','));
-  return [header, ...lines].join('\n');
+  const lines = new Array(rows.length + 1);
+  lines[0] = cols.map(csvEscapeCell).join(',');
+  for (let i = 0; i < rows.length; i++) {
+    const r = rows[i];
+    lines[i + 1] = cols.map((c) => csvEscapeCell(r[c])).join(',');
+  }
+  return lines;
 }
 
 function sanitizeFilenamePart(s) {
@@ -2589,8 +2622,13 @@ function sanitizeFilenamePart(s) {
     .slice(0, 80);
 }
 
-function downloadCsv(filename, csvText) {
-  const blob = new Blob([csvText], { type: 'text/csv;charset=utf-8' });
+function downloadCsv(filename, csvLines) {
+  const parts = [];
+  for (let i = 0; i < csvLines.length; i++) {
+    if (i) parts.push('\n');
+    parts.push(csvLines[i]);
+  }
+  const blob = new Blob(parts, { type: 'text/csv;charset=utf-8' });
   const url = URL.createObjectURL(blob);
   const a = document.createElement('a');
   a.href = url;